@@ -1,9 +1,12 @@
 import numbers
+from contextlib import ExitStack, contextmanager
 from functools import partial
 
 import numpy as np
+from joblib import cpu_count, effective_n_jobs
 from numpy.random import RandomState
 from scipy.stats import ttest_1samp, wilcoxon
+from threadpoolctl import ThreadpoolController, threadpool_limits
 
 from hidimstat.statistical_tools.nadeau_bengio_ttest import nadeau_bengio_ttest
 
@@ -37,6 +40,61 @@ def _check_vim_predict_method(method):
         )
 
 
+def _run_with_openmp_limit(limit, function, *args, **kwargs):
+    """Run `function` with the OpenMP thread pools limited to `limit` threads."""
+    with threadpool_limits(limits=limit, user_api="openmp"):
+        return function(*args, **kwargs)
+
+
+@contextmanager
+def _limit_inner_threads(n_jobs):
+    """
+    Limit the number of threads of the native libraries (BLAS, OpenMP) used
+    inside parallel jobs, to avoid oversubscription of the CPUs.
+
+    Each library is limited to ``cpu_count() // n_jobs`` threads, or keeps its
+    current limit when it is lower. The BLAS limits are global to the process
+    and are set when entering the context. The OpenMP limits only apply to the
+    thread setting them, hence they are set inside each job by wrapping the
+    function it runs.
+
+    Parameters
+    ----------
+    n_jobs : int
+        The number of parallel jobs, as given to :class:`joblib.Parallel`.
+
+    Yields
+    ------
+    limit_threads : callable
+        Function wrapping the function run by each job, to limit its OpenMP
+        threads. Nothing is limited when a single job is run.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs == 1:
+        yield lambda function: function
+        return
+
+    max_threads = max(1, cpu_count() // n_jobs)
+    controller = ThreadpoolController()
+    openmp_limit = max_threads
+    with ExitStack() as stack:
+        # select each library by its path, as different libraries can share
+        # the same prefix (e.g. the OpenBLAS of NumPy and SciPy)
+        for lib_controller in controller.lib_controllers:
+            limit = min(lib_controller.num_threads, max_threads)
+            if lib_controller.user_api == "openmp":
+                openmp_limit = min(openmp_limit, limit)
+            else:
+                stack.enter_context(
+                    controller.select(filepath=lib_controller.filepath).limit(
+                        limits=limit
+                    )
+                )
+        yield lambda function: partial(
+            _run_with_openmp_limit, openmp_limit, function
+        )
+
+
 def get_fitted_attributes(cls):
     """
     Get all attributes from a class that end with a single underscore
@@ -8,6 +8,7 @@ from tqdm import tqdm
 
 from hidimstat._utils.utils import (
     _check_vim_predict_method,
+    _limit_inner_threads,
     check_random_state,
     check_statistical_test,
 )
@@ -41,7 +42,9 @@ class BasePerturbation(BaseVariableImportance, GroupVariableImportanceMixin):
     features_groups : dict or None, default=None
         Mapping of group names to lists of feature indices or names. If None, groups are inferred.
     n_jobs : int, default=1
-        Number of parallel jobs for computation.
+        Number of parallel jobs for computation. Parallelization is done over
+        the groups of covariates, with threads by default. The backend can be
+        changed with :func:`joblib.parallel_config`.
     random_state : int or None, default=None
         Seed for reproducible permutations.
 
@@ -154,20 +157,53 @@ class BasePerturbation(BaseVariableImportance, GroupVariableImportanceMixin):
         out: array-like of shape (n_groups, n_permutations, n_samples)
             The predictions after perturbation of the data for each group of variables.
         """
-        X_ = np.asarray(X)
-        rng = check_random_state(self.random_state)
+        return self._joblib_parallel_features_groups(
+            self._joblib_predict_one_features_group, np.asarray(X)
+        )
 
-        # Parallelize the computation of the importance scores for each group
-        out_list = Parallel(n_jobs=self.n_jobs)(
-            delayed(self._joblib_predict_one_features_group)(
-                X_, features_group_id, random_state=child_state
-            )
-            for features_group_id, child_state in enumerate(
-                rng.spawn(self.n_features_groups_)
-            )
+    def _predict_loss(self, X, y):
+        """
+        Compute the loss after perturbation of the data for each group of
+        variables. The perturbed predictions are reduced to losses inside each
+        job, so that only one group of predictions is kept in memory per job.
+
+        Parameters
+        ----------
+        X: array-like of shape (n_samples, n_features)
+            The input samples.
+        y: array-like of shape (n_samples,)
+            The target values.
+
+        Returns
+        -------
+        out: ndarray of shape (n_groups, n_permutations)
+            The loss of each permutation for each group of variables.
+        """
+        return self._joblib_parallel_features_groups(
+            self._joblib_loss_one_features_group, np.asarray(X), y
         )
 
-        return np.stack(out_list, axis=0)
+    def _joblib_parallel_features_groups(self, function, *args):
+        """
+        Run `function(*args, features_group_id, random_state)` for each group of
+        variables in parallel and stack the results.
+        """
+        rng = check_random_state(self.random_state)
+
+        # Threads avoid copying X to each worker. Most of the work is done in
+        # NumPy/BLAS or compiled estimators that release the GIL.
+        with _limit_inner_threads(self.n_jobs) as limit_threads:
+            return np.stack(
+                Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                    delayed(limit_threads(function))(
+                        *args, features_group_id, random_state=child_state
+                    )
+                    for features_group_id, child_state in enumerate(
+                        rng.spawn(self.n_features_groups_)
+                    )
+                ),
+                axis=0,
+            )
 
     def importance(self, X, y):
         """
@@ -215,21 +251,13 @@ class BasePerturbation(BaseVariableImportance, GroupVariableImportanceMixin):
         y_pred = getattr(self.estimator_, self.method)(X)
         self.loss_reference_ = self.loss(y, y_pred)
 
-        y_pred = self._predict(X)
-        self.loss_ = {}
-        for j, y_pred_j in enumerate(y_pred):
-            list_loss = [self.loss(y, y_pred_perm) for y_pred_perm in y_pred_j]
-            self.loss_[j] = np.array(list_loss)
-
-        test_result = np.array(
-            [
-                self.loss_[j] - self.loss_reference_
-                for j in range(self.n_features_groups_)
-            ]
-        )
+        loss = self._predict_loss(X, y)
+        self.loss_ = dict(enumerate(loss))
+
+        test_result = loss - self.loss_reference_
         self.importances_ = np.mean(test_result, axis=1)
         self.pvalues_ = statistical_test(test_result).pvalue
-        assert self.pvalues_.shape[0] == y_pred.shape[0], (
+        assert self.pvalues_.shape[0] == loss.shape[0], (
             "The statistical test doesn't provide the correct dimension."
         )
         return self.importances_
@@ -291,15 +319,17 @@ class BasePerturbation(BaseVariableImportance, GroupVariableImportanceMixin):
             The random state to use for sampling.
         """
         features_group_ids = self._features_groups_ids[features_group_id]
-        non_features_group_ids = np.delete(
-            np.arange(X.shape[1]), features_group_ids
-        )
         # Create an array X_perm_j of shape (n_permutations, n_samples, n_features)
-        # where the j-th group of covariates is permuted
-        X_perm = np.empty((self.n_permutations, X.shape[0], X.shape[1]))
-        X_perm[:, :, non_features_group_ids] = np.delete(
-            X, features_group_ids, axis=1
+        # where the j-th group of covariates is permuted. The untouched columns
+        # are filled by broadcasting X over the permutations axis. The dtype is
+        # the NumPy promotion of X.dtype with float32, to limit the memory
+        # footprint: float32, bool and integers of at most 16 bits give
+        # float32, wider integers give float64 and float64 is kept.
+        X_perm = np.empty(
+            (self.n_permutations, X.shape[0], X.shape[1]),
+            dtype=np.promote_types(X.dtype, np.float32),
         )
+        X_perm[...] = X[np.newaxis, ...]
         X_perm[:, :, features_group_ids] = self._permutation(
             X, features_group_id=features_group_id, random_state=random_state
         )
@@ -307,14 +337,45 @@ class BasePerturbation(BaseVariableImportance, GroupVariableImportanceMixin):
         X_perm_batch = X_perm.reshape(-1, X.shape[1])
         y_pred_perm = getattr(self.estimator_, self.method)(X_perm_batch)
 
-        # In case of classification, the output is a 2D array. Reshape accordingly
-        if y_pred_perm.ndim == 1:
-            y_pred_perm = y_pred_perm.reshape(self.n_permutations, X.shape[0])
-        else:
-            y_pred_perm = y_pred_perm.reshape(
-                self.n_permutations, X.shape[0], y_pred_perm.shape[1]
+        # Split the samples axis back into (n_permutations, n_samples) and keep
+        # the trailing axes (e.g. classes in classification) as they are
+        return y_pred_perm.reshape(
+            self.n_permutations, X.shape[0], *y_pred_perm.shape[1:]
+        )
+
+    def _joblib_loss_one_features_group(
+        self, X, y, features_group_id, random_state=None
+    ):
+        """
+        Compute the loss of each permutation for a given group of variables.
+        This function is parallelized.
+
+        Parameters
+        ----------
+        X: array-like of shape (n_samples, n_features)
+            The input samples.
+        y: array-like of shape (n_samples,)
+            The target values.
+        features_group_id: int
+            The index of the group of variables.
+        random_state:
+            The random state to use for sampling.
+        """
+        y_pred_perm = self._joblib_predict_one_features_group(
+            X, features_group_id, random_state=random_state
+        )
+        y_ = np.asarray(y)
+        if (
+            self.loss is mean_squared_error
+            and y_pred_perm.shape[1:] == y_.shape
+        ):
+            # Fast path: compute the mean squared error of all the permutations
+            # at once instead of one call of the loss per permutation
+            squared_error = (y_pred_perm - y_) ** 2
+            return np.mean(
+                squared_error, axis=tuple(range(1, y_pred_perm.ndim))
             )
-        return y_pred_perm
+        return np.array([self.loss(y, y_pred) for y_pred in y_pred_perm])
 
     def _permutation(self, X, features_group_id, random_state=None):
         """Method for creating the permuted data for the j-th group of covariates."""
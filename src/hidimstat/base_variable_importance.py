@@ -549,12 +549,16 @@ class GroupVariableImportanceMixin:
             if isinstance(X, pd.DataFrame):
                 self._features_groups_ids = []
                 for features_group_key in sorted(self.features_groups_.keys()):
+                    features_group = self.features_groups_[features_group_key]
                     self._features_groups_ids.append(
-                        [
-                            i
-                            for i, col in enumerate(X.columns)
-                            if col in self.features_groups_[features_group_key]
-                        ]
+                        np.array(
+                            [
+                                i
+                                for i, col in enumerate(X.columns)
+                                if col in features_group
+                            ],
+                            dtype=int,
+                        )
                     )
             else:
                 self._features_groups_ids = [
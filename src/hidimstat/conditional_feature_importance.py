@@ -5,6 +5,7 @@ from sklearn.linear_model import LogisticRegressionCV, RidgeCV
 from sklearn.metrics import mean_squared_error
 
 from hidimstat._utils.docstring import _aggregate_docstring
+from hidimstat._utils.utils import _limit_inner_threads
 from hidimstat.base_perturbation import BasePerturbation, BasePerturbationCV
 from hidimstat.samplers.conditional_sampling import ConditionalSampler
 
@@ -53,7 +54,8 @@ class CFI(BasePerturbation):
         The random state to use for sampling.
     n_jobs : int, default=1
         The number of jobs to run in parallel. Parallelization is done over the
-        variables or groups of variables.
+        variables or groups of variables, see
+        :class:`~hidimstat.base_perturbation.BasePerturbation`.
 
     References
     ----------
@@ -150,16 +152,19 @@ class CFI(BasePerturbation):
 
         # Parallelize the fitting of the covariate estimators
         X_ = np.asarray(X)
-        self._list_imputation_models = Parallel(n_jobs=self.n_jobs)(
-            delayed(self._joblib_fit_one_features_group)(
-                imputation_model, X_, features_groups_ids
-            )
-            for features_groups_ids, imputation_model in zip(
-                self._features_groups_ids,
-                self._list_imputation_models,
-                strict=False,
+        with _limit_inner_threads(self.n_jobs) as limit_threads:
+            self._list_imputation_models = Parallel(
+                n_jobs=self.n_jobs, prefer="threads"
+            )(
+                delayed(limit_threads(self._joblib_fit_one_features_group))(
+                    imputation_model, X_, features_groups_ids
+                )
+                for features_groups_ids, imputation_model in zip(
+                    self._features_groups_ids,
+                    self._list_imputation_models,
+                    strict=False,
+                )
             )
-        )
 
         return self
 
@@ -195,7 +200,7 @@ class CFI(BasePerturbation):
         """Fit a single imputation model, for a single group of features. This method
         is parallelized.
         """
-        X_j = X[:, features_groups_ids].copy()
+        X_j = X[:, features_groups_ids]
         X_minus_j = np.delete(X, features_groups_ids, axis=1)
         estimator.fit(X_minus_j, X_j)
         return estimator
@@ -224,7 +229,7 @@ class CFI(BasePerturbation):
         """Sample from the conditional distribution using a permutation of the
         residuals.
         """
-        X_j = X[:, self._features_groups_ids[features_group_id]].copy()
+        X_j = X[:, self._features_groups_ids[features_group_id]]
         X_minus_j = np.delete(
             X, self._features_groups_ids[features_group_id], axis=1
         )
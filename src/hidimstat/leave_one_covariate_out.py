@@ -5,7 +5,10 @@ from sklearn.base import check_is_fitted, clone
 from sklearn.metrics import mean_squared_error
 
 from hidimstat._utils.docstring import _aggregate_docstring
-from hidimstat._utils.utils import check_statistical_test
+from hidimstat._utils.utils import (
+    _limit_inner_threads,
+    check_statistical_test,
+)
 from hidimstat.base_perturbation import BasePerturbation, BasePerturbationCV
 
 
@@ -37,7 +40,8 @@ class LOCO(BasePerturbation):
         the features_groups are identified based on the columns of X.
     n_jobs : int, default=1
         The number of jobs to run in parallel. Parallelization is done over the
-        variables or groups of variables.
+        variables or groups of variables, see
+        :class:`~hidimstat.base_perturbation.BasePerturbation`.
 
     Notes
     -----
@@ -93,16 +97,19 @@ class LOCO(BasePerturbation):
         ]
 
         # Parallelize the fitting of the covariate estimators
-        self._list_estimators = Parallel(n_jobs=self.n_jobs)(
-            delayed(self._joblib_fit_one_features_group)(
-                estimator, X, y, key_features_groups
-            )
-            for key_features_groups, estimator in zip(
-                self.features_groups_.keys(),
-                self._list_estimators,
-                strict=False,
+        with _limit_inner_threads(self.n_jobs) as limit_threads:
+            self._list_estimators = Parallel(
+                n_jobs=self.n_jobs, prefer="threads"
+            )(
+                delayed(limit_threads(self._joblib_fit_one_features_group))(
+                    estimator, X, y, key_features_groups
+                )
+                for key_features_groups, estimator in zip(
+                    self.features_groups_.keys(),
+                    self._list_estimators,
+                    strict=False,
+                )
             )
-        )
         return self
 
     def importance(self, X, y):
@@ -206,7 +213,8 @@ class LOCO(BasePerturbation):
             self._list_estimators[features_group_id], self.method
         )(X_minus_j)
 
-        return [y_pred_loco]
+        # add the permutations axis as a view, without a list to convert
+        return y_pred_loco[np.newaxis, ...]
 
     def _check_fit(self):
         """Check that an estimator has been fitted after removing each group of
@@ -40,7 +40,8 @@ class PFI(BasePerturbation):
         The random state to use for sampling.
     n_jobs : int, default=1
         The number of jobs to run in parallel. Parallelization is done over the
-        variables or groups of variables.
+        variables or groups of variables, see
+        :class:`~hidimstat.base_perturbation.BasePerturbation`.
 
     References
     ----------
@@ -72,15 +73,16 @@ class PFI(BasePerturbation):
     def _permutation(self, X, features_group_id, random_state=None):
         """Create the permuted data for the j-th group of covariates"""
         rng = check_random_state(random_state)
-        X_perm_j = np.array(
-            [
-                rng.permutation(
-                    X[:, self._features_groups_ids[features_group_id]].copy()
-                )
-                for _ in range(self.n_permutations)
-            ]
+        # Permute the indices of the samples for all the permutations at once
+        # instead of copying and permuting the group for each permutation
+        permutation_ids = rng.permuted(
+            np.broadcast_to(
+                np.arange(X.shape[0]), (self.n_permutations, X.shape[0])
+            ),
+            axis=1,
         )
-        return X_perm_j
+        X_j = X[:, self._features_groups_ids[features_group_id]]
+        return X_j[permutation_ids]
 
 
 def pfi_importance(
@@ -153,13 +153,22 @@ class ConditionalSampler:
                     "The model must have a `predict` method to be used for \
                         continuous data."
                 )
+            # reshape is a view: predictions have the same size as y
             y_hat = self.model.predict(X).reshape(y.shape)
             residual = y - y_hat
-            residual_permuted = np.stack(
-                [rng.permutation(residual) for _ in range(n_samples)],
-                axis=0,
+            # Draw all the permutations at once, shape (n_samples, n), and
+            # gather the permuted residuals with a single fancy indexing
+            permutation_ids = rng.permuted(
+                np.broadcast_to(
+                    np.arange(y.shape[0]), (n_samples, y.shape[0])
+                ),
+                axis=1,
             )
-            return y_hat[np.newaxis, ...] + residual_permuted
+            # add the predictions in place to the gathered residuals, to
+            # allocate a single array of shape (n_samples, *y.shape)
+            y_conditional = residual[permutation_ids]
+            y_conditional += y_hat
+            return y_conditional
 
         elif self.data_type == "categorical":
             if not hasattr(self.model, "predict_proba"):
@@ -178,13 +187,11 @@ class ConditionalSampler:
 
             y_pred_cond = []
             for index, classes in enumerate(y_classes):
-                y_pred_cond.append(
-                    np.stack(
-                        [
-                            rng.choice(classes, p=p, size=n_samples)
-                            for p in y_pred_proba[index]
-                        ],
-                        axis=1,
-                    )
-                )
+                # Inverse transform sampling for all the rows at once instead
+                # of one call to rng.choice per row
+                cdf = np.cumsum(y_pred_proba[index], axis=1)
+                cdf /= cdf[:, -1:]
+                uniform = rng.random((n_samples, cdf.shape[0], 1))
+                classes_ids = np.sum(cdf[np.newaxis, ...] <= uniform, axis=-1)
+                y_pred_cond.append(np.asarray(classes)[classes_ids])
             return np.stack(y_pred_cond, axis=-1)
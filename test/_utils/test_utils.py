@@ -1,8 +1,11 @@
 import numpy as np
 import pytest
+from joblib import Parallel, delayed
 from scipy.stats import ttest_1samp, wilcoxon
+from threadpoolctl import threadpool_info, threadpool_limits
 
 from hidimstat._utils.utils import (
+    _limit_inner_threads,
     check_random_state,
     check_statistical_test,
     get_fitted_attributes,
@@ -87,3 +90,45 @@ def test_check_test_statistic_warning():
         ValueError, match="Unsupported value for 'statistical_test'"
     ):
         check_statistical_test([])
+
+
+def _num_threads(user_api):
+    """Number of threads of the native thread pools of the calling thread"""
+    return [
+        info["num_threads"]
+        for info in threadpool_info()
+        if info["user_api"] == user_api
+    ]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, 4])
+@pytest.mark.parametrize("user_limit", [1, 8])
+def test_limit_inner_threads(monkeypatch, n_jobs, user_limit):
+    """Test that the native thread pools are limited inside the jobs, that
+    lower limits are kept, and that they are restored afterwards
+    """
+    monkeypatch.setattr("hidimstat._utils.utils.cpu_count", lambda: 8)
+    with threadpool_limits(limits=user_limit):
+        num_threads_before = [
+            info["num_threads"] for info in threadpool_info()
+        ]
+        with _limit_inner_threads(n_jobs) as limit_threads:
+            num_threads_blas = _num_threads("blas")
+            # read the OpenMP limits from the worker threads, as they are
+            # specific to each thread
+            num_threads_openmp = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(limit_threads(_num_threads))("openmp")
+                for _ in range(n_jobs)
+            )
+        num_threads_after = [info["num_threads"] for info in threadpool_info()]
+
+    expected_num_threads = min(user_limit, 8 // n_jobs)
+    assert all(
+        num_threads == expected_num_threads for num_threads in num_threads_blas
+    )
+    for num_threads_job in num_threads_openmp:
+        assert all(
+            num_threads == expected_num_threads
+            for num_threads in num_threads_job
+        )
+    assert num_threads_after == num_threads_before
@@ -943,3 +943,22 @@ def test_cfi_cv(data_generator):
     fdp, power = fdp_power(selected=selected, ground_truth=gt_mask)
     assert fdp < alpha
     assert power > 0.8
+
+
+@pytest.mark.parametrize("group", [[2], []], ids=["pair", "singleton"])
+def test_cfi_negative_group_indices(cfi_test_data, group):
+    """Test that negative indices in the groups refer to the same features as
+    their positive counterparts.
+    """
+    X_train, X_test, y_test, cfi_default_parameters = cfi_test_data
+    n_features = X_train.shape[1]
+    importances = []
+    for last_feature in [n_features - 1, -1]:
+        cfi = CFI(
+            **cfi_default_parameters,
+            features_groups={"a": [*group, last_feature], "b": [0]},
+            random_state=0,
+        )
+        cfi.fit(X_train)
+        importances.append(cfi.importance(X_test, y_test))
+    assert np.allclose(importances[0], importances[1])
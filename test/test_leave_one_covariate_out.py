@@ -214,3 +214,24 @@ def test_loco_cv(data_generator):
     fdp, power = fdp_power(selected=selected, ground_truth=gt_mask)
     assert fdp < alpha
     assert power > 0.8
+
+
+@pytest.mark.parametrize("group", [[2], []], ids=["pair", "singleton"])
+def test_loco_negative_group_indices(group):
+    """Test that negative indices in the groups refer to the same features as
+    their positive counterparts.
+    """
+    X, y, _, _ = multivariate_simulation(
+        n_samples=100, n_features=4, support_size=2, seed=0
+    )
+    X_train, X_test, y_train, y_test = train_test_split(X, y, random_state=0)
+    model = LinearRegression().fit(X_train, y_train)
+    importances = []
+    for last_feature in [X.shape[1] - 1, -1]:
+        loco = LOCO(
+            estimator=model,
+            features_groups={"a": [*group, last_feature], "b": [0]},
+        )
+        loco.fit(X_train, y_train)
+        importances.append(loco.importance(X_test, y_test))
+    assert np.allclose(importances[0], importances[1])
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from sklearn.linear_model import LassoCV, LinearRegression, LogisticRegression
-from sklearn.metrics import log_loss
+from sklearn.metrics import log_loss, mean_squared_error
 from sklearn.model_selection import KFold, train_test_split
 
 from hidimstat import PFI, PFICV, pfi_importance
@@ -237,6 +237,56 @@ def test_pfi_reproducibility_with_rng(pfi_test_data):
     assert np.array_equal(vim, vim_reproducibility)
 
 
+def test_pfi_mean_squared_error_fast_path(pfi_test_data):
+    """
+    Test that the vectorized mean squared error provides the same losses as
+    calling the loss function for each permutation.
+    """
+    X_train, X_test, y_train, y_test, pfi_default_parameters = pfi_test_data
+    pfi_fast = PFI(**pfi_default_parameters, random_state=0)
+    pfi_fast.fit(X_train, y_train)
+    vim_fast = pfi_fast.importance(X_test, y_test)
+
+    pfi_loop = PFI(
+        **pfi_default_parameters,
+        loss=lambda y_true, y_pred: mean_squared_error(y_true, y_pred),
+        random_state=0,
+    )
+    pfi_loop.fit(X_train, y_train)
+    vim_loop = pfi_loop.importance(X_test, y_test)
+
+    assert np.allclose(vim_fast, vim_loop)
+    for j in range(X_test.shape[1]):
+        assert pfi_fast.loss_[j].shape == (
+            pfi_default_parameters["n_permutations"],
+        )
+        assert np.allclose(pfi_fast.loss_[j], pfi_loop.loss_[j])
+
+
+def test_pfi_float32(pfi_test_data):
+    """
+    Test that float32 data are not upcast to float64 when perturbed and provide
+    the same importance as float64 data.
+    """
+    X_train, X_test, y_train, y_test, pfi_default_parameters = pfi_test_data
+    pfi = PFI(**pfi_default_parameters, random_state=0)
+    pfi.fit(X_train, y_train)
+    vim_64 = pfi.importance(X_test, y_test)
+
+    X_train_32 = X_train.astype(np.float32)
+    X_test_32 = X_test.astype(np.float32)
+    pfi_32 = PFI(
+        estimator=LinearRegression().fit(X_train_32, y_train),
+        n_permutations=pfi_default_parameters["n_permutations"],
+        random_state=0,
+    )
+    pfi_32.fit(X_train_32, y_train)
+    vim_32 = pfi_32.importance(X_test_32, y_test)
+
+    assert pfi_32._predict(X_test_32).dtype == np.float32
+    assert np.allclose(vim_32, vim_64, rtol=1e-3, atol=1e-4)
+
+
 @pytest.mark.parametrize(
     "n_samples, n_features, support_size, rho, seed, value, signal_noise_ratio, rho_serial",
     [(500, 100, 5, 0.0, 0, 2.0, 8, 0.0)],